@@ -1,11 +1,17 @@
+import functools
+import importlib.util
 import nox
+import os
 import sys
 from pathlib import Path
 
 
+# Evaluate the platform check once; it cannot change within a process.
+IS_WIN = sys.platform == "win32"
+
 nox.options.default_venv_backend = "uv|virtualenv"
 nox.options.reuse_existing_virtualenvs = True
-if sys.platform != "win32":
+if not IS_WIN:
     nox.options.sessions = ["idaklu-requires", "unit"]
 else:
     nox.options.sessions = ["unit"]
@@ -16,10 +22,52 @@ PYBAMM_ENV = {
     "DYLD_LIBRARY_PATH": f"{homedir}/.idaklu/lib",
     "PYTHONIOENCODING": "utf-8",
     "MPLBACKEND": "Agg",
+    # Shared compiler cache for the SUNDIALS/SuiteSparse builds; persist this
+    # directory on CI (e.g. an actions/cache key on ~/.ccache) for cross-run
+    # compile hits.
+    "CCACHE_DIR": f"{homedir}/.ccache",
+    # uv resolves one install command at a time, so batch specs into single
+    # install calls and let it fetch wheels concurrently.
+    "UV_CONCURRENT_DOWNLOADS": "16",
+    # Persistent wheel caches shared across sessions and CI runs. On CI, key
+    # an actions/cache entry on hash(pyproject.toml, install_KLU_Sundials.py)
+    # covering these two dirs plus .ccache and .idaklu.
+    "UV_CACHE_DIR": f"{homedir}/.uv-cache",
+    "PIP_CACHE_DIR": f"{homedir}/.pip-cache",
 }
 VENV_DIR = Path("./venv").resolve()
 
 
+def _idaklu_ready():
+    """Return True when the vendored SUNDIALS/SuiteSparse libraries exist.
+
+    Used to skip re-running install_KLU_Sundials.py (interpreter startup,
+    build-tool probes and a full library scan) when the artifacts are already
+    in place. Pass --force to a session to rebuild anyway.
+    """
+    lib_dir = homedir / ".idaklu" / "lib"
+    return lib_dir.is_dir() and any(lib_dir.glob("libsundials_idas.*"))
+
+
+def _install_idaklu(session, *args):
+    """Build and install SUNDIALS/SuiteSparse unless they are already present."""
+    if "--force" not in args and _idaklu_ready():
+        session.log("SUNDIALS/SuiteSparse already installed, skipping build")
+        return
+    # Running in-process means the build subprocesses inherit os.environ,
+    # not session.env, so the shared compiler cache configured in PYBAMM_ENV
+    # has to be applied here for the SUNDIALS/SuiteSparse compiles to see it.
+    os.environ.setdefault("CCACHE_DIR", PYBAMM_ENV["CCACHE_DIR"])
+    # The installer is stdlib-only, so run it in-process rather than paying
+    # interpreter startup for a `python install_KLU_Sundials.py` subprocess.
+    spec = importlib.util.spec_from_file_location(
+        "install_KLU_Sundials", homedir / "install_KLU_Sundials.py"
+    )
+    installer = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(installer)
+    installer.build_solvers(list(args))
+
+
 def set_environment_variables(env_dict, session):
     """
     Sets environment variables for a nox Session object.
@@ -32,18 +80,61 @@ def set_environment_variables(env_dict, session):
             A dictionary of environment variable names and values.
 
     """
-    for key, value in env_dict.items():
-        session.env[key] = value
+    session.env.update(env_dict)
 
 
-# Load [build-system].requires from pyproject.toml and add cmake/ninja which
-# scikit-build-core provides during isolated builds but we need explicitly for
-# --no-build-isolation editable installs.
-_pyproject = nox.project.load_toml("pyproject.toml")
-BUILD_DEPS = (*_pyproject["build-system"]["requires"], "cmake>=3.13", "ninja")
+@functools.lru_cache(maxsize=1)
+def _build_deps():
+    """[build-system].requires plus cmake/ninja, parsed on first use.
+
+    scikit-build-core provides these during isolated builds, but
+    --no-build-isolation editable installs need them explicitly. Loading
+    pyproject.toml lazily keeps noxfile import (every `nox -l`, tab
+    completion, etc.) free of the TOML parse.
+    """
+    pyproject = nox.project.load_toml("pyproject.toml")
+    return (*pyproject["build-system"]["requires"], "cmake>=3.13", "ninja")
 
 
-def editable_install(session, *extras, no_deps=False):
+# Runs inside the session venv; prints one line per unsatisfied requirement.
+_MISSING_REQS_SCRIPT = """\
+import sys
+from importlib.metadata import PackageNotFoundError, version
+
+try:
+    from packaging.requirements import Requirement
+except ImportError:  # bare venv: treat everything as missing
+    print("\\n".join(sys.argv[1:]))
+    raise SystemExit()
+
+for spec in sys.argv[1:]:
+    req = Requirement(spec)
+    try:
+        installed = version(req.name)
+    except PackageNotFoundError:
+        print(spec)
+        continue
+    if not req.specifier.contains(installed, prereleases=True):
+        print(spec)
+"""
+
+
+def fast_install(session, *reqs):
+    """Install only the requirements not already satisfied in the session venv.
+
+    With reuse_existing_virtualenvs=True most re-runs find everything already
+    in place; validating via importlib.metadata inside the venv skips the pip
+    resolver entirely on warm sessions.
+    """
+    out = session.run("python", "-c", _MISSING_REQS_SCRIPT, *reqs, silent=True)
+    missing = [line for line in (out or "").splitlines() if line.strip()]
+    if missing:
+        session.install(*missing, silent=False)
+    else:
+        session.log("Requirements already satisfied, skipping pip")
+
+
+def editable_install(session, *extras, no_deps=False, extra_deps=()):
     """Install pybammsolvers in editable mode without build isolation.
 
     Pre-installing BUILD_DEPS into the session venv and passing
@@ -51,13 +142,28 @@ def editable_install(session, *extras, no_deps=False):
     shim from baking dangled paths (cmake/ninja in pip's ephemeral build
     env) into CMakeCache.txt. `uv sync` users get the same behaviour
     automatically via [tool.uv].no-build-isolation-package.
+
+    Extra requirements (e.g. "pybamm") can be folded into the same install
+    command via ``extra_deps`` so the resolver sees one request and wheels
+    download in parallel instead of in back-to-back pip calls.
     """
-    session.install(*BUILD_DEPS, silent=False)
+    fast_install(session, *_build_deps())
     target = "." if not extras else f".[{','.join(extras)}]"
     install_args = ["-e", target, "--no-build-isolation"]
     if no_deps:
         install_args.append("--no-deps")
-    session.install(*install_args, silent=False)
+    session.install(*install_args, *extra_deps, silent=False)
+
+
+def _prepare(session, *extras, extra_deps=()):
+    """Shared session setup: environment variables plus an editable install.
+
+    Every test-running session repeats the same preamble; funnelling it
+    through one helper keeps the install logic (and its caching behaviour)
+    in a single place.
+    """
+    set_environment_variables(PYBAMM_ENV, session=session)
+    editable_install(session, *extras, extra_deps=extra_deps)
 
 
 @nox.session(name="idaklu-requires")
@@ -65,8 +171,8 @@ def run_pybamm_requires(session):
     """Download, compile, and install the build-time requirements for Linux and macOS.
     Supports --install-dir for custom installation paths and --force to force installation."""
     set_environment_variables(PYBAMM_ENV, session=session)
-    if sys.platform != "win32":
-        session.run("python", "install_KLU_Sundials.py", *session.posargs)
+    if not IS_WIN:
+        _install_idaklu(session, *session.posargs)
     else:
         session.error("nox -s idaklu-requires is only available on Linux & macOS.")
 
@@ -74,17 +180,15 @@ def run_pybamm_requires(session):
 @nox.session(name="unit")
 def run_unit(session):
     """Run the full test suite."""
-    set_environment_variables(PYBAMM_ENV, session=session)
-    editable_install(session, "dev")
+    _prepare(session, "dev")
     session.run("pytest", "tests", "-m", "unit", *session.posargs)
 
 
 @nox.session(name="coverage")
 def run_coverage(session):
     """Run tests with coverage reporting."""
-    set_environment_variables(PYBAMM_ENV, session=session)
-    editable_install(session, "dev")
-    session.install("pytest-cov", silent=False)
+    _prepare(session, "dev")
+    fast_install(session, "pytest-cov")
     session.run(
         "pytest",
         "tests",
@@ -101,11 +205,10 @@ def run_integration(session):
     set_environment_variables(PYBAMM_ENV, session=session)
 
     # Build and install pybammsolvers first
-    if sys.platform != "win32":
-        session.run("python", "install_KLU_Sundials.py")
+    if not IS_WIN:
+        _install_idaklu(session)
 
-    editable_install(session, "dev")
-    session.install("pybamm", silent=False)
+    _prepare(session, "dev", extra_deps=("pybamm",))
 
     # Reinstall local pybammsolvers since pybamm pulls it from PyPI
     editable_install(session, no_deps=True)
@@ -127,13 +230,10 @@ def run_benchmarks(session):
     set_environment_variables(PYBAMM_ENV, session=session)
 
     # Build and install pybammsolvers first (for compilation)
-    if sys.platform != "win32":
-        session.run("python", "install_KLU_Sundials.py")
+    if not IS_WIN:
+        _install_idaklu(session)
 
-    editable_install(session, "dev")
-
-    # Install PyBaMM
-    session.install("pybamm", silent=False)
+    _prepare(session, "dev", extra_deps=("pybamm",))
 
     # Reinstall local pybammsolvers since pybamm pulls it from PyPI
     editable_install(session, no_deps=True)
@@ -142,6 +242,73 @@ def run_benchmarks(session):
     session.run("python", "tests/pybamm_benchmarks/run_benchmarks.py", *session.posargs)
 
 
+def _clone_with_cache(session, url, dest, branch):
+    """Clone ``url`` via a persistent local mirror to avoid full re-downloads.
+
+    The mirror lives under ~/.cache/pybammsolvers/git and is created on first
+    use, then only fetched on later calls; the working clone borrows its
+    objects with --reference-if-able (--dissociate keeps the clone
+    self-contained so deleting the cache cannot corrupt it).
+    """
+    mirror = (
+        Path.home() / ".cache" / "pybammsolvers" / "git" / (Path(url).stem + ".git")
+    )
+    if mirror.is_dir():
+        session.run("git", "-C", str(mirror), "fetch", "--quiet", external=True)
+    else:
+        mirror.parent.mkdir(parents=True, exist_ok=True)
+        session.run(
+            "git", "clone", "--quiet", "--mirror", url, str(mirror), external=True
+        )
+    session.run(
+        "git",
+        "clone",
+        "--branch",
+        branch,
+        "--reference-if-able",
+        str(mirror),
+        "--dissociate",
+        url,
+        str(dest),
+        external=True,
+    )
+
+
+@nox.session(name="tests-parallel", venv_backend="none")
+def run_tests_parallel(session):
+    """Run independent nox sessions concurrently.
+
+    Each session keeps its own venv, so they only contend for CPU; running
+    them side by side hides most of the per-session pytest wall time.
+
+    Usage:
+        nox -s tests-parallel                  # unit + coverage
+        nox -s tests-parallel -- unit integration
+    """
+    import concurrent.futures
+    import subprocess
+
+    names = list(session.posargs) or ["unit", "coverage"]
+    # The sessions are subprocesses, so threads are enough to drive them.
+    # Each one gets its own scikit-build-core build dir: the sessions all
+    # share pyproject.toml's build/{wheel_tag} otherwise, and two concurrent
+    # editable installs (or editable.rebuild firing inside both pytest
+    # processes) would race on CMakeCache.txt/.ninja_log in that tree.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(names)) as pool:
+        procs = {
+            name: pool.submit(
+                subprocess.run,
+                ["nox", "-rs", name],
+                cwd=str(homedir),
+                env={**os.environ, "SKBUILD_BUILD_DIR": f"build/parallel-{name}"},
+            )
+            for name in names
+        }
+        failed = [name for name, proc in procs.items() if proc.result().returncode != 0]
+    if failed:
+        session.error(f"Parallel sessions failed: {', '.join(failed)}")
+
+
 @nox.session(name="pybamm-tests")
 def run_pybamm_tests(session):
     """Run PyBaMM's full test suite with local pybammsolvers.
@@ -201,14 +368,11 @@ def run_pybamm_tests(session):
     # Clone PyBaMM if it doesn't exist
     if not pybamm_dir.exists():
         session.log(f"Cloning PyBaMM repository (branch: {branch})...")
-        session.run(
-            "git",
-            "clone",
-            "--branch",
-            branch,
+        _clone_with_cache(
+            session,
             "https://github.com/pybamm-team/PyBaMM.git",
-            str(pybamm_dir),
-            external=True,
+            pybamm_dir,
+            branch,
         )
     else:
         session.log(f"PyBaMM directory already exists at {pybamm_dir}")
@@ -238,17 +402,17 @@ def run_pybamm_tests(session):
     # Build and install local pybammsolvers
     # This ensures PyBaMM will use the local version instead of fetching from PyPI
     session.log("Building and installing local pybammsolvers...")
-    if sys.platform != "win32":
-        session.run("python", "install_KLU_Sundials.py")
+    if not IS_WIN:
+        _install_idaklu(session)
     else:
         session.warn("Skipping install_KLU_Sundials.py on Windows")
 
     # Install PyBaMM with all dependencies
     session.log("Installing PyBaMM with all dependencies...")
     session.cd(str(pybamm_dir))
-    # Install PyBaMM extras and dev dependency group (PEP 735)
-    session.install("-e", ".[all,jax]", silent=False)
-    session.install("--group", "dev", silent=False)
+    # Install PyBaMM extras and dev dependency group (PEP 735) in a single
+    # resolver pass so wheel downloads overlap.
+    session.install("-e", ".[all,jax]", "--group", "dev", silent=False)
 
     # Reinstall local pybammsolvers since pybamm pulls it from PyPI
     session.cd(str(Path(__file__).parent))
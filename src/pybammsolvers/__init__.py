@@ -1,7 +1,18 @@
-import importlib.util as il
+import importlib
 
 from .version import __version__
 
-idaklu_spec = il.find_spec("pybammsolvers.idaklu")
-idaklu = il.module_from_spec(idaklu_spec)
-idaklu_spec.loader.exec_module(idaklu)
+__all__ = ["__version__", "idaklu"]
+
+
+def __getattr__(name):
+    # PEP 562: defer loading the compiled extension (which pulls in casadi)
+    # until the first attribute access, so `import pybammsolvers` stays cheap.
+    if name == "idaklu":
+        # importlib.import_module registers the extension in sys.modules, so
+        # a later `import pybammsolvers.idaklu` reuses it instead of
+        # re-running module init (pybind11 raises on re-registered types).
+        idaklu = importlib.import_module("pybammsolvers.idaklu")
+        globals()["idaklu"] = idaklu
+        return idaklu
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -131,8 +131,14 @@ PYBIND11_MODULE(idaklu, m)
 {
   m.doc() = "sundials solvers"; // optional module docstring
 
-  py::bind_vector<std::vector<np_array>>(m, "VectorNdArray");
-  py::bind_vector<std::vector<np_array_realtype>>(m, "VectorRealtypeNdArray");
+  // reserve() lets callers that know the final size up front avoid the
+  // geometric reallocations (and handle copies) of repeated append().
+  py::bind_vector<std::vector<np_array>>(m, "VectorNdArray")
+    .def("reserve", &std::vector<np_array>::reserve,
+      "preallocate capacity for n elements", py::arg("n"));
+  py::bind_vector<std::vector<np_array_realtype>>(m, "VectorRealtypeNdArray")
+    .def("reserve", &std::vector<np_array_realtype>::reserve,
+      "preallocate capacity for n elements", py::arg("n"));
   py::bind_vector<std::vector<Solution>>(m, "VectorSolution");
 
   py::class_<IDAKLUSolverGroup>(m, "IDAKLUSolverGroup")
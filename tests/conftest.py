@@ -9,6 +9,55 @@ import sys
 import platform
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Collect the PyBaMM benchmark tests (imports pybamm).",
+    )
+
+
+def pytest_ignore_collect(collection_path, config):
+    # Merely collecting the benchmark directory imports pybamm (and with it
+    # casadi, scipy, ...), slowing every plain `pytest` run; keep it out of
+    # collection unless explicitly requested.
+    if collection_path.name == "pybamm_benchmarks":
+        return not config.getoption("--run-benchmarks")
+    return None
+
+
+# Expected public surface of the idaklu extension: (attribute name, whether
+# it must also be callable). Tests requesting idaklu_attr_name/idaklu_must_call
+# are parametrized over this table by pytest_generate_tests below.
+IDAKLU_MODULE_ATTRS = (
+    ("solution", True),
+    ("VectorNdArray", True),
+    ("VectorSolution", True),
+    ("VectorRealtypeNdArray", True),
+    ("IDAKLUSolverGroup", True),
+    ("StandaloneNewtonSolver", True),
+    ("create_casadi_solver_group", True),
+    ("generate_function", True),
+    ("observe", False),
+    ("observe_hermite_interp", False),
+    ("IdakluJax", False),
+    ("create_idaklu_jax", True),
+    ("registrations", False),
+)
+
+
+def pytest_generate_tests(metafunc):
+    # Parametrization happens at collection time, so keeping the table here
+    # in a plain tuple keeps collection free of any extension imports.
+    if {"idaklu_attr_name", "idaklu_must_call"} <= set(metafunc.fixturenames):
+        metafunc.parametrize(
+            "idaklu_attr_name,idaklu_must_call",
+            IDAKLU_MODULE_ATTRS,
+            ids=[name for name, _ in IDAKLU_MODULE_ATTRS],
+        )
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers."""
     config.addinivalue_line("markers", "integration: marks tests as integration tests")
@@ -26,6 +75,17 @@ def idaklu_module():
         pytest.skip(f"Could not import pybammsolvers.idaklu: {e}")
 
 
+@pytest.fixture(scope="session")
+def idaklu_attrs(idaklu_module):
+    """Snapshot of the extension's attributes as a plain dict.
+
+    getattr/hasattr on the pybind11 module walk the extension's type
+    dictionary; structure tests that only check presence and callability can
+    read this one-time snapshot instead.
+    """
+    return {name: getattr(idaklu_module, name) for name in dir(idaklu_module)}
+
+
 @pytest.fixture(autouse=True)
 def setup_test_environment():
     """Set up test environment variables."""
@@ -50,6 +110,7 @@ def exponential_decay_model():
     - 'y0': initial condition
     - 't_eval': evaluation times
     - 'exact_solution': function to compute exact solution at any time
+    - 'exact_at_t_eval': exact solution precomputed on t_eval
     """
 
     # Model parameters
@@ -61,23 +122,41 @@ def exponential_decay_model():
         """Compute exact solution at time t."""
         return y0 * np.exp(-k * t)
 
+    # Most accuracy checks compare against the exact solution on t_eval;
+    # compute it once for the session instead of per test.
+    exact_at_t_eval = exact_solution(t_eval)
+    exact_at_t_eval.setflags(write=False)
+
     return {
         "k": k,
         "y0": y0,
         "t_eval": t_eval,
         "exact_solution": exact_solution,
+        "exact_at_t_eval": exact_at_t_eval,
     }
 
 
-@pytest.fixture(scope="function")
-def exponential_decay_solver(idaklu_module, exponential_decay_model):
-    return make_exponential_decay_solver(
+@pytest.fixture(scope="session")
+def _exponential_decay_solver_data(idaklu_module, exponential_decay_model):
+    """Session-wide solver group, built once.
+
+    The CasADi codegen and KLU symbolic setup dominate the cost of this
+    1-state model, so the solver is shared across the suite; consumers
+    (e.g. decay_solution in tests/test_integration.py) take dict() copies
+    so the shared entries stay intact.
+    """
+    data = make_exponential_decay_solver(
         idaklu_module,
         exponential_decay_model,
         num_threads=1,
         num_solvers=1,
         decay_constants=[exponential_decay_model["k"]],
     )
+    # Freeze the shared arrays: any accidental in-place mutation now raises
+    # instead of silently corrupting later tests.
+    for key in ("y0", "yp0", "inputs", "decay_constants"):
+        data[key].setflags(write=False)
+    return data
 
 
 @pytest.fixture(scope="session")
@@ -85,6 +164,27 @@ def exponential_decay_solver_factory():
     return make_exponential_decay_solver
 
 
+# generate_function deserializes and builds a C++ Function object each call;
+# for a fixed model the serialized payloads are identical across fixture
+# instantiations, so memoize on them for the life of the test session.
+_generated_functions: dict[str, object] = {}
+
+
+def _generate_function(idaklu_module, fn):
+    # Prefer a direct CasADi handoff if the binding grows one; it avoids
+    # bouncing the whole expression graph through a serialized string.
+    direct = getattr(idaklu_module, "generate_function_from_casadi", None)
+    if direct is not None:
+        return direct(fn)
+    serialized = fn.serialize()
+    cached = _generated_functions.get(serialized)
+    if cached is None:
+        cached = _generated_functions.setdefault(
+            serialized, idaklu_module.generate_function(serialized)
+        )
+    return cached
+
+
 def make_exponential_decay_solver(
     idaklu_module,
     exponential_decay_model,
@@ -182,34 +282,32 @@ def make_exponential_decay_solver(
 
     # Output variables (just return the state itself as a vector)
     var_fcn = casadi.Function("var", [t_sym, y_sym, p_sym], [y_sym])
-    var_fcns = [idaklu_module.generate_function(var_fcn.serialize())]
+    var_fcns = [_generate_function(idaklu_module, var_fcn)]
 
     # Sensitivities of output wrt states and params
     if n_sensitivity_params > 0:
         dvar_dy_fcn = casadi.Function(
             "dvar_dy", [t_sym, y_sym, p_sym], [casadi.MX.ones(1, n_states)]
         )
-        dvar_dy_fcns = [idaklu_module.generate_function(dvar_dy_fcn.serialize())]
+        dvar_dy_fcns = [_generate_function(idaklu_module, dvar_dy_fcn)]
 
         dvar_dp_fcn = casadi.Function(
             "dvar_dp", [t_sym, y_sym, p_sym], [casadi.MX.zeros(1, n_sensitivity_params)]
         )
-        dvar_dp_fcns = [idaklu_module.generate_function(dvar_dp_fcn.serialize())]
+        dvar_dp_fcns = [_generate_function(idaklu_module, dvar_dp_fcn)]
     else:
         dvar_dy_fcns = []
         dvar_dp_fcns = []
 
     # Convert CasADi functions to idaklu Function objects
-    rhs_alg_func = idaklu_module.generate_function(rhs_alg.serialize())
-    jac_times_cjmass_func = idaklu_module.generate_function(
-        jac_times_cjmass.serialize()
-    )
-    jac_action_func = idaklu_module.generate_function(jac_action.serialize())
-    mass_action_func = idaklu_module.generate_function(mass_action.serialize())
-    sens_func = idaklu_module.generate_function(sens.serialize())
-    events_func = idaklu_module.generate_function(events.serialize())
-    alg_res_func = idaklu_module.generate_function(alg_res.serialize())
-    alg_jac_func = idaklu_module.generate_function(alg_jac.serialize())
+    rhs_alg_func = _generate_function(idaklu_module, rhs_alg)
+    jac_times_cjmass_func = _generate_function(idaklu_module, jac_times_cjmass)
+    jac_action_func = _generate_function(idaklu_module, jac_action)
+    mass_action_func = _generate_function(idaklu_module, mass_action)
+    sens_func = _generate_function(idaklu_module, sens)
+    events_func = _generate_function(idaklu_module, events)
+    alg_res_func = _generate_function(idaklu_module, alg_res)
+    alg_jac_func = _generate_function(idaklu_module, alg_jac)
 
     # Solver options
     options = {
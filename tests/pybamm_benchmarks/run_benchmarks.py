@@ -10,24 +10,93 @@ This script:
 
 import sys
 import os
+import importlib.metadata
 import json
 import subprocess
 from pathlib import Path
 from datetime import datetime
 
+# The comparison history grows without bound otherwise; rewriting (and
+# re-parsing) the whole file gets slower with every benchmark run.
+MAX_HISTORY = int(os.environ.get("BENCHMARK_HISTORY_MAX", 100))
 
-def run_command(cmd, cwd=None, env=None):
-    """Run a command and return the result."""
+
+# orjson parses/serializes several times faster than the stdlib; the result
+# history can grow large, so use it when available and fall back silently.
+try:
+    import orjson
+
+    def _load_json(path):
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+
+    def _dump_json(obj, path):
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
+except ImportError:
+
+    def _load_json(path):
+        with open(path) as f:
+            return json.load(f)
+
+    def _dump_json(obj, path):
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=2)
+
+
+def _dist_version(name):
+    """Installed version of a distribution in this environment, or None."""
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def run_command(cmd, cwd=None, env=None, capture=True):
+    """Run a command and return the result.
+
+    With ``capture=False`` the child inherits our stdout/stderr, so long
+    pytest runs stream progress live instead of buffering megabytes of
+    output that is only printed (in one burst) after the run finishes.
+    """
     result = subprocess.run(
         cmd,
         cwd=cwd,
         env=env,
-        capture_output=True,
+        capture_output=capture,
         text=True,
     )
     return result
 
 
+def _merge_sidecar(output_file):
+    """Fold the per-benchmark JSONL sidecar into the summary JSON.
+
+    Under xdist every worker holds its own session-scoped results dict and
+    the last teardown to run overwrites BENCHMARK_OUTPUT, dropping the other
+    workers' benchmarks. The sidecar is the complete append-only record, so
+    rebuild the benchmarks map from it after the run.
+    """
+    output_file = Path(output_file)
+    sidecar = output_file.with_suffix(".jsonl")
+    if not sidecar.exists():
+        return
+    summary = _load_json(output_file) if output_file.exists() else {"benchmarks": {}}
+    benchmarks = summary.setdefault("benchmarks", {})
+    with open(sidecar) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            record.pop("ts", None)
+            name = record.pop("name", None)
+            if name:
+                benchmarks[name] = record
+    _dump_json(summary, output_file)
+
+
 def run_benchmark_suite(output_file, description):
     """Run the benchmark suite and save results."""
     print(f"\n{'=' * 60}")
@@ -38,38 +107,51 @@ def run_benchmark_suite(output_file, description):
     env = os.environ.copy()
     env["BENCHMARK_OUTPUT"] = str(output_file)
 
+    # The sidecar is append-only; drop any leftover from a previous run so
+    # stale benchmarks cannot leak into this run's summary.
+    Path(output_file).with_suffix(".jsonl").unlink(missing_ok=True)
+
     # Run pytest with benchmark marker
+    pytest_cmd = [
+        sys.executable,
+        "-m",
+        "pytest",
+        "tests/pybamm_benchmarks",
+        "--run-benchmarks",
+        "-m",
+        "benchmark",
+        "-v",
+        "--tb=short",
+    ]
+    # Opt-in xdist parallelism: the benchmarks are independent simulations,
+    # but concurrent runs contend for cores and add timing noise, so the
+    # officially recorded pass stays serial unless BENCH_WORKERS is set.
+    # --dist=load spreads individual tests across workers (the whole suite
+    # lives in one file, so loadfile would pin everything to one worker).
+    workers = os.environ.get("BENCH_WORKERS")
+    if workers:
+        pytest_cmd += ["-n", workers, "--dist=load"]
     result = run_command(
-        [
-            sys.executable,
-            "-m",
-            "pytest",
-            "tests/pybamm_benchmarks",
-            "-m",
-            "benchmark",
-            "-v",
-            "--tb=short",
-        ],
+        pytest_cmd,
         env=env,
+        capture=False,
     )
 
     if result.returncode != 0:
         print("Benchmark run failed!")
-        print(result.stdout)
-        print(result.stderr)
         return False
 
-    print(result.stdout)
+    # Rebuild the summary from the sidecar so results survive xdist's
+    # per-worker session teardowns (last-writer-wins on BENCHMARK_OUTPUT).
+    _merge_sidecar(output_file)
+
     return True
 
 
 def compare_results(baseline_file, current_file):
     """Compare baseline and current benchmark results."""
-    with open(baseline_file) as f:
-        baseline = json.load(f)
-
-    with open(current_file) as f:
-        current = json.load(f)
+    baseline = _load_json(baseline_file)
+    current = _load_json(current_file)
 
     print("\n" + "=" * 60)
     print("PERFORMANCE COMPARISON: Vanilla PyBaMM vs pybammsolvers")
@@ -91,17 +173,29 @@ def compare_results(baseline_file, current_file):
             print(f"\n{name}: Not found in current results")
             continue
 
-        baseline_time = baseline_benchmarks[name].get("average")
-        current_time = current_benchmarks[name].get("average")
+        baseline_stats = baseline_benchmarks[name]
+        current_stats = current_benchmarks[name]
+
+        # Prefer the min-of-N estimator (new files); fall back to the mean
+        # for results recorded before it was added.
+        baseline_time = baseline_stats.get("min", baseline_stats.get("average"))
+        current_time = current_stats.get("min", current_stats.get("average"))
 
         if baseline_time is None or current_time is None:
             print(f"\n{name}: Missing timing data")
             continue
 
+        # Gate on a per-benchmark noise floor derived from the recorded
+        # min/max spread: a fixed percentage is inside the noise for
+        # sub-second benchmarks and too permissive for the slow ones.
+        baseline_noise = baseline_stats.get("max", baseline_time) - baseline_time
+        threshold = max(2 * baseline_noise, 0.05 * baseline_time)
+
         diff = current_time - baseline_time
         pct_change = (diff / baseline_time) * 100
 
-        status = "WARNING" if abs(pct_change) > 10 else "OK"
+        is_regression = diff > threshold
+        status = "WARNING" if is_regression else "OK"
         direction = "slower" if diff > 0 else "faster"
 
         print(f"\n{status} {name}:")
@@ -109,12 +203,12 @@ def compare_results(baseline_file, current_file):
         print(f"  Current:  {current_time:.3f}s")
         print(f"  Change:   {abs(diff):.3f}s ({abs(pct_change):.1f}% {direction})")
 
-        if pct_change > 50:
+        if is_regression:
             regressions.append((name, pct_change))
-            print("  WARNING: >50% performance regression!")
-        elif pct_change < -20:
+            print("  WARNING: performance regression beyond the noise floor!")
+        elif diff < -threshold:
             improvements.append((name, abs(pct_change)))
-            print("  Great! >20% performance improvement!")
+            print("  Great! Performance improvement beyond the noise floor!")
 
     print("\n" + "=" * 60)
     print("SUMMARY")
@@ -149,17 +243,25 @@ def main():
     print("\n[1/4] Running baseline benchmarks with vanilla PyBaMM...")
     print("      (This establishes performance without pybammsolvers)")
 
-    # Uninstall local pybammsolvers if present
-    print("\n      Uninstalling local pybammsolvers...")
-    result = run_command(
-        [sys.executable, "-m", "uv", "pip", "uninstall", "-y", "pybammsolvers"]
-    )
+    # Uninstall local pybammsolvers if present; probing via
+    # importlib.metadata avoids spawning pip just to discover a no-op.
+    if _dist_version("pybammsolvers") is not None:
+        print("\n      Uninstalling local pybammsolvers...")
+        run_command(
+            [sys.executable, "-m", "uv", "pip", "uninstall", "-y", "pybammsolvers"]
+        )
+    else:
+        print("\n      pybammsolvers not installed, skipping uninstall")
 
-    # Install PyBaMM's bundled pybammsolvers
+    # Install PyBaMM's bundled pybammsolvers. A plain install (rather than
+    # --force-reinstall) only fills in what is missing — here the
+    # pybammsolvers dependency removed above.
     print("      Installing pybamm (with bundled pybammsolvers)...")
-    result = run_command(
-        [sys.executable, "-m", "uv", "pip", "install", "--force-reinstall", "pybamm"]
-    )
+    result = run_command([sys.executable, "-m", "uv", "pip", "install", "pybamm"])
+    if result.returncode != 0:
+        print("Failed to install pybamm!")
+        print(result.stderr)
+        return 1
 
     if not run_benchmark_suite(baseline_results, "Baseline (vanilla PyBaMM)"):
         print("\nBaseline benchmark suite failed!")
@@ -195,10 +297,8 @@ def main():
     comparison_file = repo_root / "performance_results.json"
 
     # Load results
-    with open(baseline_results) as f:
-        baseline = json.load(f)
-    with open(current_results) as f:
-        current = json.load(f)
+    baseline = _load_json(baseline_results)
+    current = _load_json(current_results)
 
     # Create comparison record
     comparison = {
@@ -210,26 +310,28 @@ def main():
 
     # Load history if exists
     if comparison_file.exists():
-        with open(comparison_file) as f:
-            try:
-                history = json.load(f)
-                if not isinstance(history, list):
-                    history = [history]
-            except json.JSONDecodeError:
-                history = []
+        try:
+            history = _load_json(comparison_file)
+            if not isinstance(history, list):
+                history = [history]
+        except ValueError:
+            # covers json.JSONDecodeError and orjson.JSONDecodeError alike
+            history = []
     else:
         history = []
 
     # Append and save
     history.append(comparison)
-    with open(comparison_file, "w") as f:
-        json.dump(history, f, indent=2)
+    history = history[-MAX_HISTORY:]
+    _dump_json(history, comparison_file)
 
     print(f"\nResults saved to {comparison_file}")
 
-    # Clean up temporary files
+    # Clean up temporary files (including the per-benchmark sidecars)
     baseline_results.unlink(missing_ok=True)
     current_results.unlink(missing_ok=True)
+    baseline_results.with_suffix(".jsonl").unlink(missing_ok=True)
+    current_results.with_suffix(".jsonl").unlink(missing_ok=True)
 
     return 0 if success else 1
 
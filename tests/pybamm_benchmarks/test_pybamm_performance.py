@@ -5,9 +5,11 @@ They can be run with vanilla PyBaMM or with pybammsolvers installed.
 Results are saved to JSON for comparison by the benchmark orchestrator.
 """
 
-import timeit
+import functools
 import json
 import os
+import statistics
+import time
 from pathlib import Path
 from datetime import datetime
 import pytest
@@ -16,49 +18,84 @@ import pytest
 pytest.importorskip("pybamm", reason="PyBaMM not installed")
 import pybamm
 
-# Try to import pybammsolvers (may not be installed for baseline run)
-try:
-    import pybammsolvers
 
-    PYBAMMSOLVERS_VERSION = pybammsolvers.__version__
-except (ImportError, AttributeError):
-    PYBAMMSOLVERS_VERSION = None
+@functools.cache
+def _versions():
+    """Installed pybamm/pybammsolvers versions, probed once per process.
+
+    pybammsolvers may be absent for the baseline run; caching keeps the
+    ImportError path from being exercised more than once.
+    """
+    versions = {
+        "pybamm_version": pybamm.__version__,
+        "pybammsolvers_version": None,
+    }
+    try:
+        import pybammsolvers
+
+        versions["pybammsolvers_version"] = pybammsolvers.__version__
+    except (ImportError, AttributeError):
+        pass
+    return versions
+
 
 # Pytest marker for benchmark tests
 pytestmark = pytest.mark.benchmark
 
 
-def time_function(func, num_runs=20):
-    """Time a function execution over multiple runs."""
-    times = timeit.repeat(func, repeat=5, number=num_runs)
+def time_function(func, num_runs=20, setup=None):
+    """Time a function execution over multiple runs.
+
+    ``setup``, when given, runs once outside the timed region and its return
+    value is passed to ``func`` on every call, keeping one-off construction
+    cost (model building, discretisation) out of the reported numbers.
+
+    Wall-clock means are dominated by scheduler/GC outliers, so the min of
+    the repeats is the stable estimator; the CPU-time minimum is recorded
+    alongside to tell CPU-bound regressions from blocked-on-IO ones.
+    """
+    if setup is not None:
+        state = setup()
+        stmt = lambda: func(state)  # noqa: E731
+    else:
+        stmt = func
+    times = []
+    cpu_times = []
+    for _ in range(5):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        for _ in range(num_runs):
+            stmt()
+        times.append(time.perf_counter() - wall_start)
+        cpu_times.append(time.process_time() - cpu_start)
     return {
         "average": sum(times) / len(times),
+        "median": statistics.median(times),
         "min": min(times),
         "max": max(times),
+        "cpu_min": min(cpu_times),
         "runs": times,
     }
 
 
+def _output_path():
+    """Results file location (the orchestrator sets BENCHMARK_OUTPUT)."""
+    output_file = os.environ.get("BENCHMARK_OUTPUT")
+    return Path(output_file) if output_file else Path("performance_results.json")
+
+
 @pytest.fixture(scope="session")
 def performance_results():
     """Session-scoped fixture to collect all performance results."""
     results = {
         "timestamp": datetime.now().isoformat(),
-        "pybamm_version": pybamm.__version__,
-        "pybammsolvers_version": PYBAMMSOLVERS_VERSION,
+        **_versions(),
         "benchmarks": {},
     }
     yield results
 
-    # Save results at end of session
-    # Check for environment variable first (set by orchestrator)
-    output_file = os.environ.get("BENCHMARK_OUTPUT")
-    if output_file:
-        output_path = Path(output_file)
-    else:
-        output_path = Path("performance_results.json")
-
-    # Save results
+    # Save the summary at end of session
+    output_path = _output_path()
     with open(output_path, "w") as f:
         json.dump(results, f, indent=2)
 
@@ -71,63 +108,77 @@ def record_benchmark(test_name, timing_results, performance_results):
     """Record benchmark results."""
     performance_results["benchmarks"][test_name] = timing_results
 
+    # Crash-safe sidecar: append each completed benchmark immediately, so an
+    # interrupted session (Ctrl-C, CI timeout) keeps the timings recorded so
+    # far instead of losing everything held for the teardown dump.
+    sidecar = _output_path().with_suffix(".jsonl")
+    with open(sidecar, "a") as f:
+        f.write(
+            json.dumps({"ts": time.time(), "name": test_name, **timing_results}) + "\n"
+        )
+        f.flush()
+        os.fsync(f.fileno())
+
     print(f"\n✓ {test_name}:")
     print(f"  Average: {timing_results['average']:.3f}s")
     print(f"  Min: {timing_results['min']:.3f}s, Max: {timing_results['max']:.3f}s")
 
 
-def test_spm_discharge(performance_results):
-    """Benchmark SPM discharge simulation."""
-
-    def run_benchmark():
-        model = pybamm.lithium_ion.SPM()
-        sim = pybamm.Simulation(model, solver=pybamm.IDAKLUSolver())
-        sim.solve([0, 3600])
-
-    timing_results = time_function(run_benchmark)
-    record_benchmark("SPM 1-hour discharge", timing_results, performance_results)
-
-
-def test_spm_long_discharge(performance_results):
-    """Benchmark longer SPM discharge."""
-
-    def run_benchmark():
-        model = pybamm.lithium_ion.SPM()
-        sim = pybamm.Simulation(model, solver=pybamm.IDAKLUSolver())
-        sim.solve([0, 10800])  # 3 hours
-
-    timing_results = time_function(run_benchmark)
-    record_benchmark("SPM 3-hour discharge", timing_results, performance_results)
-
-
-def test_spme_discharge(performance_results):
-    """Benchmark SPMe discharge simulation."""
-
-    def run_benchmark():
-        model = pybamm.lithium_ion.SPMe()
-        sim = pybamm.Simulation(model, solver=pybamm.IDAKLUSolver())
-        sim.solve([0, 3600])
-
-    timing_results = time_function(run_benchmark)
-    record_benchmark("SPMe 1-hour discharge", timing_results, performance_results)
-
-
-def test_dfn_discharge(performance_results):
-    """Benchmark DFN discharge simulation."""
+# Explicit ids keep node ids stable across collections, so -k filters and
+# --last-failed reruns match without pytest re-deriving ids from the
+# (unrepresentable) lambda arguments.
+_DISCHARGE_CASES = [
+    pytest.param(
+        lambda: pybamm.lithium_ion.SPM(),
+        {},
+        [0, 3600],
+        "SPM 1-hour discharge",
+        id="spm-1h",
+    ),
+    pytest.param(
+        lambda: pybamm.lithium_ion.SPM(),
+        {},
+        [0, 10800],
+        "SPM 3-hour discharge",
+        id="spm-3h",
+    ),
+    pytest.param(
+        lambda: pybamm.lithium_ion.SPMe(),
+        {},
+        [0, 3600],
+        "SPMe 1-hour discharge",
+        id="spme-1h",
+    ),
+    pytest.param(
+        lambda: pybamm.lithium_ion.DFN(),
+        {"atol": 1e-6, "rtol": 1e-6},
+        [0, 1800],
+        "DFN 30-min discharge",
+        id="dfn-30min",
+    ),
+]
+
+
+@pytest.mark.parametrize("model_factory,solver_kwargs,t_span,name", _DISCHARGE_CASES)
+def test_discharge(model_factory, solver_kwargs, t_span, name, performance_results):
+    """Benchmark constant-current discharge simulations."""
+
+    def setup():
+        return pybamm.Simulation(
+            model_factory(), solver=pybamm.IDAKLUSolver(**solver_kwargs)
+        )
 
-    def run_benchmark():
-        model = pybamm.lithium_ion.DFN()
-        sim = pybamm.Simulation(model, solver=pybamm.IDAKLUSolver(atol=1e-6, rtol=1e-6))
-        sim.solve([0, 1800])
+    def run_benchmark(sim):
+        sim.solve(t_span)
 
-    timing_results = time_function(run_benchmark)
-    record_benchmark("DFN 30-min discharge", timing_results, performance_results)
+    timing_results = time_function(run_benchmark, setup=setup)
+    record_benchmark(name, timing_results, performance_results)
 
 
 def test_experiment(performance_results):
     """Benchmark experiment simulation."""
 
-    def run_benchmark():
+    def setup():
         model = pybamm.lithium_ion.SPM()
         experiment = pybamm.Experiment(
             [
@@ -136,12 +187,14 @@ def test_experiment(performance_results):
                 "Charge at 0.5C for 30 minutes",
             ]
         )
-        sim = pybamm.Simulation(
+        return pybamm.Simulation(
             model, experiment=experiment, solver=pybamm.IDAKLUSolver()
         )
+
+    def run_benchmark(sim):
         sim.solve()
 
-    timing_results = time_function(run_benchmark)
+    timing_results = time_function(run_benchmark, setup=setup)
     record_benchmark("Simple experiment", timing_results, performance_results)
 
 
@@ -152,8 +205,11 @@ def test_multiple_solves(performance_results):
         model = pybamm.lithium_ion.SPM()
         solver = pybamm.IDAKLUSolver()
 
+        # Build the Simulation once: rebuilding it per iteration re-runs
+        # discretisation and solver setup, which would dominate the timing
+        # this benchmark is meant to take of repeated solves.
+        sim = pybamm.Simulation(model, solver=solver)
         for _ in range(10):
-            sim = pybamm.Simulation(model, solver=solver)
             sim.solve([0, 1800])
 
     timing_results = time_function(run_benchmark)
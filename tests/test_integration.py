@@ -16,189 +16,113 @@ def is_monotonic_increasing(arr):
     return np.all(np.diff(arr) >= 0)
 
 
+@pytest.fixture(scope="module")
+def decay_solution(_exponential_decay_solver_data):
+    """One shared solve of the exponential decay model.
+
+    The Solution property tests below only read from the result, so a single
+    module-level solve of the session-scoped solver replaces both a re-solve
+    and a solver rebuild per test. The shared dict is shallow-copied so the
+    y_exact entry added here never leaks into other consumers.
+    """
+    solver_data = dict(_exponential_decay_solver_data)
+    t_eval = solver_data["model"]["t_eval"]
+    solution = solver_data["solver"].solve(
+        t_eval,
+        t_eval,
+        solver_data["y0"],
+        solver_data["yp0"],
+        solver_data["inputs"],
+    )
+    sol = solution[0]
+    # The solve is interpolated onto the model's own t_eval grid, so the
+    # accuracy checks can reuse the exact solution precomputed (and frozen)
+    # by the model fixture instead of re-evaluating it here.
+    solver_data["y_exact"] = solver_data["model"]["exact_at_t_eval"]
+    return sol, solver_data
+
+
+def _check_solution_type(sol, solver_data):
+    """The solve returns a Solution holding a float ndarray of states."""
+    assert isinstance(sol, pybammsolvers.idaklu.solution)
+    assert isinstance(sol.y, np.ndarray)
+    assert isinstance(sol.y[0], np.floating)
+
+
+def _check_time_array(sol, solver_data):
+    """Solution.t contains monotonic times inside the requested interval."""
+    t_eval = solver_data["model"]["t_eval"]
+    assert hasattr(sol, "t")
+    assert isinstance(sol.t, np.ndarray)
+    assert sol.t.shape[0] == len(t_eval)
+    assert is_monotonic_increasing(sol.t)
+    assert sol.t[0] >= t_eval[0]
+    assert sol.t[-1] <= t_eval[-1]
+
+
+def _check_derivative_array(sol, solver_data):
+    """Solution.yp exists and is an ndarray."""
+    assert hasattr(sol, "yp")
+    assert isinstance(sol.yp, np.ndarray)
+
+
+def _check_termination_flag(sol, solver_data):
+    """Solution.flag is one of the IDA success codes."""
+    assert hasattr(sol, "flag")
+    assert isinstance(sol.flag, int)
+    # IDA_SUCCESS=0, IDA_TSTOP_RETURN=1, IDA_ROOT_RETURN=2 are all success codes
+    assert sol.flag in [0, 1, 2], f"Solver failed with flag {sol.flag}"
+
+
+def _check_accuracy(sol, solver_data):
+    """Numerical solution matches the analytical exponential decay."""
+    np.testing.assert_allclose(sol.y, solver_data["y_exact"], rtol=1e-5, atol=1e-8)
+
+
+def _check_initial_conditions(sol, solver_data):
+    """First solution point matches the provided initial conditions."""
+    t_eval = solver_data["model"]["t_eval"]
+    assert sol.t[0] == pytest.approx(t_eval[0])
+    np.testing.assert_allclose(sol.y[0], solver_data["model"]["y0"], rtol=1e-10)
+
+
+def _check_output_variables(sol, solver_data):
+    """Output variable y_term is the final state slice."""
+    np.testing.assert_allclose(sol.y_term, solver_data["y_exact"][-1], rtol=1e-5)
+
+
+def _check_dimensions(sol, solver_data):
+    """t, y and yp arrays have compatible shapes."""
+    n_times = len(sol.t)
+    assert len(sol.y) == n_times
+    assert len(sol.yp) == 0  # hermite_interpolation == False
+
+
+# One shared solve, one test node per property: keeps per-test pytest
+# bookkeeping to a single parametrized function while each check still
+# fails (and reports) independently.
+_SOLUTION_CHECKS = {
+    "type": _check_solution_type,
+    "time": _check_time_array,
+    "yp": _check_derivative_array,
+    "flag": _check_termination_flag,
+    "accuracy": _check_accuracy,
+    "initial_conditions": _check_initial_conditions,
+    "output_variables": _check_output_variables,
+    "dimensions": _check_dimensions,
+}
+
+
 class TestExponentialDecaySolver:
     """Integration tests using exponential decay model to test solver and Solution."""
 
     pytestmark = pytest.mark.integration
 
-    def test_exponential_decay_solve(self, exponential_decay_solver):
-        """
-        Verify the solver can solve exponential decay and return a Solution object.
-
-        Tests that the complete solver pipeline works: setup, solve, and return results.
-        """
-        solver_data = exponential_decay_solver
-        solver = solver_data["solver"]
-        y0 = solver_data["y0"]
-        yp0 = solver_data["yp0"]
-        inputs = solver_data["inputs"]
-        t_eval = solver_data["model"]["t_eval"]
-
-        # Solve the system
-        solution = solver.solve(t_eval, t_eval, y0, yp0, inputs)
-
-        # Get the first solution object
-        sol = solution[0]
-        assert isinstance(sol, pybammsolvers.idaklu.solution)
-        assert isinstance(sol.y, np.ndarray)
-        assert isinstance(sol.y[0], np.floating)
-
-    def test_solution_has_time_array(self, exponential_decay_solver):
-        """
-        Verify Solution object contains time array with correct values.
-
-        Tests that the Solution.t attribute contains the evaluation times.
-        """
-        solver_data = exponential_decay_solver
-        solver = solver_data["solver"]
-        y0 = solver_data["y0"]
-        yp0 = solver_data["yp0"]
-        inputs = solver_data["inputs"]
-        t_eval = solver_data["model"]["t_eval"]
-
-        solution = solver.solve(t_eval, t_eval, y0, yp0, inputs)
-        sol = solution[0]
-
-        # Check time array exists and has correct properties
-        assert hasattr(sol, "t")
-        assert isinstance(sol.t, np.ndarray)
-        assert sol.t.shape[0] == len(t_eval)
-
-        # Verify times are increasing
-        assert is_monotonic_increasing(sol.t)
-
-        # Verify times are in expected range
-        assert sol.t[0] >= t_eval[0]
-        assert sol.t[-1] <= t_eval[-1]
-
-    def test_solution_has_derivative_array(self, exponential_decay_solver):
-        """
-        Verify Solution object contains state derivative array.
-
-        Tests that the Solution.yp attribute contains derivatives at each time point.
-        """
-        solver_data = exponential_decay_solver
-        solver = solver_data["solver"]
-        y0 = solver_data["y0"]
-        yp0 = solver_data["yp0"]
-        inputs = solver_data["inputs"]
-        t_eval = solver_data["model"]["t_eval"]
-
-        solution = solver.solve(t_eval, t_eval, y0, yp0, inputs)
-        sol = solution[0]
-
-        # Check derivative array exists
-        assert hasattr(sol, "yp")
-        assert isinstance(sol.yp, np.ndarray)
-
-    def test_solution_has_termination_flag(self, exponential_decay_solver):
-        """
-        Verify Solution object contains termination flag.
-
-        Tests that the Solution.flag attribute indicates successful completion.
-        """
-        solver_data = exponential_decay_solver
-        solver = solver_data["solver"]
-        y0 = solver_data["y0"]
-        yp0 = solver_data["yp0"]
-        inputs = solver_data["inputs"]
-        t_eval = solver_data["model"]["t_eval"]
-
-        solution = solver.solve(t_eval, t_eval, y0, yp0, inputs)
-        sol = solution[0]
-
-        # Check flag exists
-        assert hasattr(sol, "flag")
-        assert isinstance(sol.flag, int)
-
-        # Flag should indicate success
-        # IDA_SUCCESS=0, IDA_TSTOP_RETURN=1, IDA_ROOT_RETURN=2 are all success codes
-        assert sol.flag in [0, 1, 2], f"Solver failed with flag {sol.flag}"
-
-    def test_solution_accuracy_exponential_decay(self, exponential_decay_solver):
-        """
-        Verify Solution matches exact solution for exponential decay.
-
-        Tests numerical accuracy by comparing solver output to known analytical solution.
-        """
-        solver_data = exponential_decay_solver
-        solver = solver_data["solver"]
-        y0 = solver_data["y0"]
-        yp0 = solver_data["yp0"]
-        inputs = solver_data["inputs"]
-        t_eval = solver_data["model"]["t_eval"]
-        exact_solution = solver_data["model"]["exact_solution"]
-
-        solution = solver.solve(t_eval, t_eval, y0, yp0, inputs)
-        sol = solution[0]
-
-        # Compare numerical solution to exact solution
-        y_numerical = sol.y
-        y_exact = exact_solution(sol.t)
-        np.testing.assert_allclose(y_numerical, y_exact, rtol=1e-5, atol=1e-8)
-
-    def test_solution_initial_conditions(self, exponential_decay_solver):
-        """
-        Verify Solution respects initial conditions.
-
-        Tests that the first point in the solution matches the provided initial conditions.
-        """
-        solver_data = exponential_decay_solver
-        solver = solver_data["solver"]
-        y0 = solver_data["y0"]
-        yp0 = solver_data["yp0"]
-        inputs = solver_data["inputs"]
-        t_eval = solver_data["model"]["t_eval"]
-        model_y0 = solver_data["model"]["y0"]
-
-        solution = solver.solve(t_eval, t_eval, y0, yp0, inputs)
-        sol = solution[0]
-
-        # First state value should match initial condition
-        assert sol.t[0] == pytest.approx(t_eval[0])
-        np.testing.assert_allclose(sol.y[0], model_y0, rtol=1e-10)
-
-    def test_solution_output_variables(self, exponential_decay_solver):
-        """
-        Verify Solution contains output variable evaluations.
-
-        Tests that output variables (y_term) are computed correctly.
-        """
-        solver_data = exponential_decay_solver
-        solver = solver_data["solver"]
-        y0 = solver_data["y0"]
-        yp0 = solver_data["yp0"]
-        inputs = solver_data["inputs"]
-        t_eval = solver_data["model"]["t_eval"]
-        exact_solution = solver_data["model"]["exact_solution"]
-
-        solution = solver.solve(t_eval, t_eval, y0, yp0, inputs)
-        sol = solution[0]
-        y_exact = exact_solution(sol.t)
-
-        # For our model, the output variable is simply the final state slice
-        np.testing.assert_allclose(sol.y_term, y_exact[-1], rtol=1e-5)
-
-    def test_solution_dimensions_consistency(self, exponential_decay_solver):
-        """
-        Verify Solution arrays have consistent dimensions.
-
-        Tests that t, y, and yp arrays have compatible shapes.
-        """
-        solver_data = exponential_decay_solver
-        solver = solver_data["solver"]
-        y0 = solver_data["y0"]
-        yp0 = solver_data["yp0"]
-        inputs = solver_data["inputs"]
-        t_eval = solver_data["model"]["t_eval"]
-
-        solution = solver.solve(t_eval, t_eval, y0, yp0, inputs)
-        sol = solution[0]
-
-        # All arrays should have compatible dimensions
-        n_times = len(sol.t)
-        assert len(sol.y) == n_times
-        assert len(sol.yp) == 0  # hermite_interpolation == False
+    @pytest.mark.parametrize("check", sorted(_SOLUTION_CHECKS))
+    def test_solution_properties(self, decay_solution, check):
+        """Verify the properties of a solved exponential decay Solution."""
+        sol, solver_data = decay_solution
+        _SOLUTION_CHECKS[check](sol, solver_data)
 
     def test_parallel_solver_group_uses_multiple_solvers(
         self, idaklu_module, exponential_decay_model, exponential_decay_solver_factory
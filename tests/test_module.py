@@ -31,42 +31,18 @@ class TestPackageStructure:
         assert isinstance(pybammsolvers.__version__, str)
         assert len(pybammsolvers.__version__) > 0
 
-    def test_idaklu_module_attributes(self, idaklu_module):
+    def test_idaklu_module_attributes(
+        self, idaklu_attrs, idaklu_attr_name, idaklu_must_call
+    ):
         """
         Verify idaklu module exposes the expected classes and functions.
 
         The module should provide Solution, VectorNdArray, VectorSolution for managing
-        solver results, and IdakluJax for JAX integration.
+        solver results, and IdakluJax for JAX integration. The expected
+        attribute table lives in conftest.py (IDAKLU_MODULE_ATTRS) and is
+        expanded by pytest_generate_tests, so a missing or non-callable
+        attribute fails its own test case.
         """
-
-        # Core solution classes
-        assert hasattr(idaklu_module, "solution")
-        assert hasattr(idaklu_module, "VectorNdArray")
-        assert hasattr(idaklu_module, "VectorSolution")
-        assert hasattr(idaklu_module, "VectorRealtypeNdArray")
-
-        # Solver classes
-        assert hasattr(idaklu_module, "IDAKLUSolverGroup")
-        assert hasattr(idaklu_module, "StandaloneNewtonSolver")
-
-        # Core functions
-        assert hasattr(idaklu_module, "create_casadi_solver_group")
-        assert hasattr(idaklu_module, "generate_function")
-        assert hasattr(idaklu_module, "observe")
-        assert hasattr(idaklu_module, "observe_hermite_interp")
-
-        # JAX integration
-        assert hasattr(idaklu_module, "IdakluJax")
-        assert hasattr(idaklu_module, "create_idaklu_jax")
-        assert hasattr(idaklu_module, "registrations")
-
-        # Verify key classes and functions are callable/instantiable
-        assert callable(idaklu_module.solution)
-        assert callable(idaklu_module.VectorNdArray)
-        assert callable(idaklu_module.VectorSolution)
-        assert callable(idaklu_module.VectorRealtypeNdArray)
-        assert callable(idaklu_module.IDAKLUSolverGroup)
-        assert callable(idaklu_module.StandaloneNewtonSolver)
-        assert callable(idaklu_module.create_casadi_solver_group)
-        assert callable(idaklu_module.generate_function)
-        assert callable(idaklu_module.create_idaklu_jax)
+        assert idaklu_attr_name in idaklu_attrs
+        if idaklu_must_call:
+            assert callable(idaklu_attrs[idaklu_attr_name])